@@ -1,36 +1,60 @@
 # Copyright 2023 The Milton Hirsch Institute, B.V.
 # SPDX-License-Identifier: Apache-2.0
 
+import dataclasses
 import datetime
+from typing import TYPE_CHECKING
 
 import pytest
 
-from tyminator import clock as clock_module
-from tyminator import defaults
+if TYPE_CHECKING:
+    from tyminator import clock as clock_module
+
+
+@dataclasses.dataclass(frozen=True)
+class ClockDefaults:
+    start: datetime.datetime
+    local_tz: datetime.tzinfo
+    step: "clock_module.Step"
 
 
 @pytest.fixture
-def clock(clock_start, clock_step, clock_local_tz) -> clock_module.Clock:
+def clock(clock_start, clock_step, clock_local_tz) -> "clock_module.Clock":
+    from tyminator import clock as clock_module
+
     return clock_module.Clock(clock_start, clock_step, local_tz=clock_local_tz)
 
 
-@pytest.fixture
-def clock_start() -> datetime.datetime:
-    return defaults.DEFAULT_CLOCK_START
+@pytest.fixture(scope="session")
+def clock_defaults() -> ClockDefaults:
+    from tyminator import defaults
 
+    return ClockDefaults(
+        start=defaults.DEFAULT_CLOCK_START,
+        local_tz=defaults.DEFAULT_LOCAL_TZ,
+        step=1,
+    )
 
-@pytest.fixture
-def clock_local_tz() -> datetime.tzinfo:
-    return defaults.DEFAULT_LOCAL_TZ
 
+@pytest.fixture(scope="session")
+def clock_start(clock_defaults) -> datetime.datetime:
+    return clock_defaults.start
 
-@pytest.fixture
-def clock_step() -> clock_module.Step:
-    return 1
+
+@pytest.fixture(scope="session")
+def clock_local_tz(clock_defaults) -> datetime.tzinfo:
+    return clock_defaults.local_tz
+
+
+@pytest.fixture(scope="session")
+def clock_step(clock_defaults) -> "clock_module.Step":
+    return clock_defaults.step
 
 
 __all__ = (
+    "ClockDefaults",
     "clock",
+    "clock_defaults",
     "clock_local_tz",
     "clock_start",
     "clock_step",
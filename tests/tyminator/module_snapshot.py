@@ -0,0 +1,23 @@
+# Copyright 2023 The Milton Hirsch Institute, B.V.
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from typing import Any
+
+
+def snapshot_module(module: types.ModuleType) -> dict[str, Any]:
+    return dict(module.__dict__)
+
+
+def restore_module(module: types.ModuleType, snapshot: dict[str, Any]) -> None:
+    """Removes names added since the snapshot and rebinds the rest."""
+    module_dict = module.__dict__
+    for name in module_dict.keys() - snapshot.keys():
+        del module_dict[name]
+    module_dict.update(snapshot)
+
+
+__all__ = (
+    "restore_module",
+    "snapshot_module",
+)
@@ -2,17 +2,26 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import copy
 import dataclasses
 import datetime
-import importlib
+import re
 import time
+import unittest.mock
+import weakref
+from typing import Any
+from typing import Coroutine
+from typing import TypeVar
 
 import pytest
 
+from tests.tyminator import module_snapshot
 from tests.tyminator import target_module
 from tyminator import clock as clock_module
 from tyminator import defaults
 
+T = TypeVar("T")
+
 
 @dataclasses.dataclass(frozen=True)
 class CallCollector:
@@ -27,39 +36,121 @@ class CallCollector:
         self(clock)
 
 
+class PlainOffsetTz(datetime.tzinfo):
+    """Fixed offset that is not a datetime.timezone."""
+
+    def utcoffset(self, dt):
+        return datetime.timedelta(hours=-7)
+
+    def dst(self, dt):
+        return None
+
+
+class UnhashableOffsetTz(PlainOffsetTz):
+    """Defines __eq__ without __hash__, like dateutil's tz classes."""
+
+    def __eq__(self, other):
+        return isinstance(other, UnhashableOffsetTz)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExpectedConversions:
+    tz_start: datetime.datetime
+    utc_start: datetime.datetime
+    timestamp: float
+    tz_timestamp: float
+    utc_timestamp: float
+
+
+def run_without_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine that never suspends, without an event loop."""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise AssertionError("coroutine suspended")
+
+
 @pytest.fixture
 def call_collector(clock) -> CallCollector:
     return CallCollector(clock)
 
 
-@pytest.fixture(autouse=True)
-def reloaded_target_module():
+@pytest.fixture(scope="module")
+def expected_conversions(clock_start, clock_local_tz) -> ExpectedConversions:
+    tz_start = clock_start.replace(tzinfo=clock_local_tz)
+    utc_start = tz_start.astimezone(datetime.timezone.utc)
+    return ExpectedConversions(
+        tz_start=tz_start,
+        utc_start=utc_start,
+        timestamp=clock_start.timestamp(),
+        tz_timestamp=tz_start.timestamp(),
+        utc_timestamp=utc_start.timestamp(),
+    )
+
+
+@pytest.fixture(scope="module")
+def run_deltas() -> tuple[datetime.timedelta, ...]:
+    return tuple(datetime.timedelta(seconds=s) for s in (1, 1.5, 1.5, 2))
+
+
+# Captured at collection, before any test can leak a patch.
+ORIGINAL_TIME_FUNCTIONS = (time.time, time.sleep, asyncio.sleep)
+
+
+@pytest.fixture
+def time_functions_restored():
     try:
         yield
     finally:
-        importlib.reload(target_module)
+        original_time, original_sleep, original_async_sleep = ORIGINAL_TIME_FUNCTIONS
+        assert time.time is original_time
+        assert time.sleep is original_sleep
+        assert asyncio.sleep is original_async_sleep
+
+
+TZ_MINUS_7_HOURS = datetime.timezone(datetime.timedelta(hours=-7))
+TZ_PLUS_10_HOURS = datetime.timezone(datetime.timedelta(hours=10))
+TZ_PLUS_10_SECONDS = datetime.timezone(datetime.timedelta(seconds=10))
+
+CHANGE_MUST_BE_POSITIVE = re.compile(r"^change must be positive")
+MUST_BE_INT_OR_FLOAT = re.compile(r"^must be int or float$")
+TIME_MUST_BE_IN_FUTURE = re.compile(r"^time must be in the future$")
+
+# Enough rounds for the interpreter to specialize the next_* call sites.
+NEXT_ITERATIONS = 32
+
+INVALID_SECS = [None, "2", defaults.DEFAULT_CLOCK_START, datetime.timedelta(seconds=2)]
+
+STEP_TIMEDELTAS = [(i, datetime.timedelta(seconds=i)) for i in range(1, 5)]
+
+NUMBER_CHANGES = (-2, -1, 0, 1, 2, -1.0, -0.5, 0.0, 0.5, 1.0)
+NUMBER_CHANGE_IDS = ("m2", "m1", "0", "1", "2", "m1.0", "m0.5", "0.0", "0.5", "1.0")
+
+POSITIVE_CHANGES = (0, 1, 2, 0.0, 0.5, 1.0)
+POSITIVE_CHANGE_IDS = ("0", "1", "2", "0.0", "0.5", "1.0")
 
 
 class TestFromStep:
     @staticmethod
-    @pytest.mark.parametrize("int_step", range(1, 5))
-    def test_int(int_step):
-        expected = datetime.timedelta(seconds=int_step)
+    @pytest.mark.parametrize("int_step,expected", STEP_TIMEDELTAS)
+    def test_int(int_step, expected):
         assert clock_module.from_step(int_step) == expected
 
     @staticmethod
-    @pytest.mark.parametrize("int_step", range(1, 5))
-    def test_timedelta(int_step):
-        expected = datetime.timedelta(seconds=int_step)
-        assert clock_module.from_step(expected) is expected
+    @pytest.mark.parametrize("timedelta_step", [td for _, td in STEP_TIMEDELTAS])
+    def test_timedelta(timedelta_step):
+        assert clock_module.from_step(timedelta_step) is timedelta_step
+
+    @staticmethod
+    def test_int_subclass():
+        assert clock_module.from_step(True) == datetime.timedelta(seconds=1)
 
 
 class TestFromChange:
     @staticmethod
-    @pytest.mark.parametrize(
-        "number_change",
-        [*range(-2, 3), *[i * 0.5 for i in range(-2, 3)]],
-    )
+    @pytest.mark.parametrize("number_change", NUMBER_CHANGES, ids=NUMBER_CHANGE_IDS)
     def test_numbers(number_change):
         expected = datetime.timedelta(seconds=number_change)
         assert clock_module.from_change(number_change) == expected
@@ -71,6 +162,10 @@ class TestFromChange:
     def test_timedelta(timedelta_change):
         assert clock_module.from_change(timedelta_change) is timedelta_change
 
+    @staticmethod
+    def test_int_subclass():
+        assert clock_module.from_change(True) == datetime.timedelta(seconds=1)
+
 
 class TestClock:
     class TestConstructor:
@@ -81,60 +176,37 @@ class TestClock:
                 clock_module.Clock(tz_start, clock_local_tz)
 
         @staticmethod
-        def test_start(clock, clock_start, clock_local_tz):
+        def test_start(clock, clock_start, expected_conversions):
             assert clock.start == clock_start
-            clock_tz_start = clock_start.replace(tzinfo=clock_local_tz)
-            assert clock.tz_start == clock_tz_start
-            clock_utc_start = clock_tz_start.astimezone(datetime.timezone.utc)
-            assert clock.utc_start == clock_utc_start
+            assert clock.tz_start == expected_conversions.tz_start
+            assert clock.utc_start == expected_conversions.utc_start
 
         @staticmethod
         def test_current_datetime(clock, clock_start, clock_step):
             assert clock.current_datetime == clock_start
 
         @staticmethod
-        def test_current_tz_datetime(clock, clock_start, clock_local_tz):
-            expected = clock_start.replace(tzinfo=clock_local_tz)
-            assert clock.current_tz_datetime == expected
+        def test_current_tz_datetime(clock, expected_conversions):
+            assert clock.current_tz_datetime == expected_conversions.tz_start
 
         @staticmethod
-        def test_current_utc_datetime(clock, clock_start, clock_local_tz):
-            expected = clock_start.replace(tzinfo=clock_local_tz)
-            expected = expected.astimezone(datetime.timezone.utc)
-            assert clock.current_utc_datetime == expected
+        def test_current_utc_datetime(clock, expected_conversions):
+            assert clock.current_utc_datetime == expected_conversions.utc_start
 
         @staticmethod
         @pytest.mark.parametrize(
             "clock_step,expected",
-            [
-                (1, datetime.timedelta(seconds=1)),
-                (2, datetime.timedelta(seconds=2)),
-                (3, datetime.timedelta(seconds=3)),
-                (4, datetime.timedelta(seconds=4)),
-            ],
+            [*STEP_TIMEDELTAS, *[(td, td) for _, td in STEP_TIMEDELTAS]],
         )
-        def test_int_step(clock, expected):
+        def test_step(clock, clock_step, expected):
             assert clock.step == expected
+            if isinstance(clock_step, datetime.timedelta):
+                assert clock.step is clock_step
 
-        @staticmethod
-        @pytest.mark.parametrize(
-            "clock_step",
-            [
-                datetime.timedelta(seconds=1),
-                datetime.timedelta(seconds=2),
-                datetime.timedelta(seconds=3),
-                datetime.timedelta(seconds=4),
-            ],
-        )
-        def test_timedelta_step(clock, clock_step):
-            assert clock.step is clock_step
-
-        def test_current_timestamp(self, clock, clock_start, clock_local_tz):
-            assert clock.current_timestamp == clock_start.timestamp()
-            clock_tz_start = clock_start.replace(tzinfo=clock_local_tz)
-            assert clock.current_tz_timestamp == clock_tz_start.timestamp()
-            clock_utf_start = clock_tz_start.astimezone(datetime.timezone.utc)
-            assert clock.current_utc_timestamp == clock_utf_start.timestamp()
+        def test_current_timestamp(self, clock, expected_conversions):
+            assert clock.current_timestamp == expected_conversions.timestamp
+            assert clock.current_tz_timestamp == expected_conversions.tz_timestamp
+            assert clock.current_utc_timestamp == expected_conversions.utc_timestamp
 
         def test_local_tz(self, clock, clock_local_tz):
             assert clock.local_tz is clock_local_tz
@@ -145,30 +217,88 @@ class TestClock:
         "clock_step", [datetime.timedelta(seconds=1), datetime.timedelta(minutes=2)]
     )
     def test_elapsed(clock, steps, clock_step):
-        for _ in range(steps):
-            clock.next_datetime()
-
+        clock.elapse_steps(steps)
         assert clock.elapsed == clock_step * steps
 
     @staticmethod
-    def test_current_utc_datetime(clock, clock_start, clock_local_tz):
-        expected = clock_start.replace(tzinfo=clock_local_tz)
-        expected = expected.astimezone(datetime.timezone.utc)
-        assert clock.current_utc_datetime == expected
+    @pytest.mark.parametrize("steps", [0, 1, 1000])
+    @pytest.mark.parametrize("clock_local_tz", [TZ_MINUS_7_HOURS, PlainOffsetTz()])
+    def test_elapsed_timestamps(clock, steps):
+        clock.elapse(datetime.timedelta(seconds=steps, microseconds=steps))
+        expected = clock.current_tz_datetime.timestamp()
+        assert clock.current_tz_timestamp == expected
+        assert clock.current_utc_timestamp == expected
+
+    @staticmethod
+    @pytest.mark.parametrize("clock_local_tz", [datetime.timezone.utc])
+    def test_utc_local_tz(clock):
+        clock.elapse_steps()
+        assert clock.current_utc_datetime is clock.current_tz_datetime
+        assert clock.current_utc_datetime.tzinfo is datetime.timezone.utc
+        utc = clock.as_utc(clock.current_datetime)
+        assert utc == clock.current_tz_datetime
+        assert utc.tzinfo is datetime.timezone.utc
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "start,hours",
+        [(datetime.datetime.min, 2), (datetime.datetime.max, -2)],
+    )
+    def test_unrepresentable_utc_start(start, hours):
+        local_tz = datetime.timezone(datetime.timedelta(hours=hours))
+        clock = clock_module.Clock(start, local_tz=local_tz)
+        assert clock.tz_start.tzinfo is local_tz
+        with pytest.raises(OverflowError):
+            clock.utc_start
+
+    @staticmethod
+    def test_patch_method(clock):
+        with unittest.mock.patch.object(clock, "time_function", return_value=1.0):
+            assert clock.time_function() == 1.0
+        assert clock.time_function() == clock.start.timestamp()
+
+    @staticmethod
+    def test_equal_but_distinct_local_tz(clock_start):
+        offset = datetime.timedelta(hours=2)
+        clocks = [
+            clock_module.Clock(clock_start, local_tz=datetime.timezone(offset, name))
+            for name in ("CEST", "EET")
+        ]
+        for clock in clocks:
+            local_tz = clock.local_tz
+            assert clock.tz_start.tzinfo is local_tz
+            assert clock.as_tz(clock_start).tzinfo is local_tz
+            assert clock.as_tz(clock.utc_start).tzinfo is local_tz
+            assert clock.current_tz_datetime.tzinfo is local_tz
+            assert clock.mark().tz_when.tzinfo is local_tz
+
+    @staticmethod
+    @pytest.mark.parametrize("clock_local_tz", [UnhashableOffsetTz()])
+    def test_unhashable_local_tz(clock, clock_local_tz):
+        assert clock.tz_start.tzinfo is clock_local_tz
+        assert clock.as_tz(clock.start).tzinfo is clock_local_tz
+        assert clock.utc_start == clock.tz_start
+        assert clock.mark().utc_when == clock.utc_start
 
     class TestTzConversion:
         @staticmethod
-        @pytest.fixture
+        @pytest.fixture(scope="class")
+        def clock(clock_start, clock_step, clock_local_tz):
+            """Conversions never advance the clock, so one is shared."""
+            return clock_module.Clock(clock_start, clock_step, local_tz=clock_local_tz)
+
+        @staticmethod
+        @pytest.fixture(scope="class")
         def naive():
             return datetime.datetime(2014, 1, 1, 12)
 
         @staticmethod
-        @pytest.fixture
+        @pytest.fixture(scope="class")
         def tz(naive):
-            return naive.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=-7)))
+            return naive.replace(tzinfo=TZ_MINUS_7_HOURS)
 
         @staticmethod
-        @pytest.fixture
+        @pytest.fixture(scope="class")
         def utc(tz):
             return tz.astimezone(datetime.timezone.utc)
 
@@ -202,6 +332,10 @@ class TestClock:
                     2014, 1, 1, 21, tzinfo=clock_local_tz
                 )
 
+            @staticmethod
+            def test_local(clock):
+                assert clock.as_tz(clock.tz_start) is clock.tz_start
+
         class TestAsUtc:
             @staticmethod
             def test_naive(clock, naive):
@@ -217,7 +351,8 @@ class TestClock:
 
             @staticmethod
             def test_utc(clock, utc):
-                assert clock.as_utc(utc) == datetime.datetime(
+                assert clock.as_utc(utc) is utc
+                assert utc == datetime.datetime(
                     2014, 1, 1, 19, tzinfo=datetime.timezone.utc
                 )
 
@@ -232,16 +367,21 @@ class TestClock:
             ],
         )
         def test_negative_changes(clock, change):
-            with pytest.raises(ValueError, match="^change must be positive"):
+            with pytest.raises(ValueError, match=CHANGE_MUST_BE_POSITIVE):
                 assert clock.elapse(change)
 
         @staticmethod
-        @pytest.mark.parametrize("change", [*range(3), *(s * 0.5 for s in range(3))])
+        def test_negative_steps(clock):
+            with pytest.raises(ValueError, match=CHANGE_MUST_BE_POSITIVE):
+                clock.elapse_steps(-1)
+            assert clock.current_datetime == clock.start
+
+        @staticmethod
+        @pytest.mark.parametrize("change", POSITIVE_CHANGES, ids=POSITIVE_CHANGE_IDS)
         def test_positive_number(clock, change):
             clock.elapse(change)
-            assert clock.current_datetime == clock.start + clock_module.from_change(
-                change
-            )
+            expected = datetime.timedelta(seconds=change)
+            assert clock.current_datetime == clock.start + expected
 
         @staticmethod
         @pytest.mark.parametrize(
@@ -261,66 +401,54 @@ class TestClock:
     @pytest.mark.parametrize("clock_step", [1, 5, datetime.timedelta(minutes=2)])
     class TestNextDatetime:
         @staticmethod
-        def test_datetime(clock, clock_start):
-            for step in range(4):
-                next_datetime = clock.next_datetime()
-                assert next_datetime == clock_start + (clock.step * step)
-                assert next_datetime == clock.current_datetime - clock.step
-
-        @staticmethod
-        def test_tz_datetime(clock, clock_start):
-            for step in range(4):
-                next_tz_datetime = clock.next_tz_datetime()
-                assert next_tz_datetime == clock.current_tz_datetime - clock.step
-
-        @staticmethod
-        def test_utc_datetime(clock, clock_start):
-            for step in range(4):
-                next_utc_datetime = clock.next_utc_datetime()
-                assert next_utc_datetime == clock.current_utc_datetime - clock.step
-
-        @staticmethod
-        def test_next_timestamp(clock, clock_start):
-            for step in range(4):
-                next_timestamp = clock.next_timestamp()
-                assert next_timestamp == (clock_start + clock.step * step).timestamp()
-                assert (
-                    next_timestamp == (clock.current_datetime - clock.step).timestamp()
-                )
-
-        @staticmethod
-        def test_next_tz_timestamp(clock, clock_start):
-            for step in range(4):
-                next_tz_timestamp = clock.next_tz_timestamp()
-                assert (
-                    next_tz_timestamp
-                    == (clock.current_tz_datetime - clock.step).timestamp()
+        def test_next(clock, clock_start):
+            next_functions = (
+                clock.next_datetime,
+                clock.next_tz_datetime,
+                clock.next_utc_datetime,
+                clock.next_timestamp,
+                clock.next_tz_timestamp,
+                clock.next_utc_timestamp,
+            )
+            actual = [
+                next_function()
+                for _ in range(NEXT_ITERATIONS)
+                for next_function in next_functions
+            ]
+
+            expected = []
+            for step in range(len(actual)):
+                naive = clock_start + clock.step * step
+                tz = clock.tz_start + clock.step * step
+                utc = clock.utc_start + clock.step * step
+                values = (
+                    naive,
+                    tz,
+                    utc,
+                    naive.timestamp(),
+                    tz.timestamp(),
+                    utc.timestamp(),
                 )
+                expected.append(values[step % len(values)])
 
-        @staticmethod
-        def test_next_utc_timestamp(clock, clock_start):
-            for step in range(4):
-                next_utc_timestamp = clock.next_utc_timestamp()
-                assert (
-                    next_utc_timestamp
-                    == (clock.current_utc_datetime - clock.step).timestamp()
-                )
+            assert actual == expected
+            assert clock.current_datetime == clock_start + clock.step * len(actual)
 
         @staticmethod
         def test_dt_at_step(clock):
-            for step in range(-3, 4):
+            for step in (-3, 0, 3):
                 dt_at_step = clock.dt_at_step(step)
                 assert dt_at_step == clock.start + (clock.step * step)
 
         @staticmethod
         def test_dt_tz_at_step(clock):
-            for step in range(-3, 4):
+            for step in (-3, 0, 3):
                 tz_dt_at_step = clock.tz_dt_at_step(step)
                 assert tz_dt_at_step == clock.tz_start + (clock.step * step)
 
         @staticmethod
         def test_dt_utc_at_step(clock):
-            for step in range(-3, 4):
+            for step in (-3, 0, 3):
                 utc_dt_at_step = clock.utc_dt_at_step(step)
                 assert utc_dt_at_step == clock.utc_start + (clock.step * step)
 
@@ -343,46 +471,53 @@ class TestClock:
                     assert clock.current_timestamp == next_timestamp
 
     @staticmethod
-    @pytest.mark.parametrize("secs", [0, 1, 2, 0.0, 0.1, 2.2])
-    def test_sleep_function(clock, secs):
+    @pytest.mark.parametrize(
+        "secs,expected",
+        [(s, datetime.timedelta(seconds=s)) for s in [0, 1, 2, 0.0, 0.1, 2.2]],
+    )
+    def test_sleep_function(clock, secs, expected):
         clock.sleep_function(secs)
-        assert clock.current_datetime == clock.start + clock_module.from_change(secs)
+        assert clock.current_datetime == clock.start + expected
+
+    @staticmethod
+    @pytest.mark.parametrize("bad_secs", INVALID_SECS)
+    def test_sleep_function_invalid_secs(clock, bad_secs):
+        with pytest.raises(TypeError, match=MUST_BE_INT_OR_FLOAT):
+            clock.sleep_function(bad_secs)
+        assert clock.current_datetime == clock.start
 
-    @pytest.mark.asyncio
     class TestAsyncSleepFunction:
         @staticmethod
-        async def test_with_loop(clock):
-            loop = asyncio.new_event_loop()
+        def test_with_loop(clock):
             with pytest.raises(
                 NotImplementedError, match=r"loop parameter is unsupported"
             ):
-                await clock.async_sleep_function(1, loop=loop)
+                run_without_loop(clock.async_sleep_function(1, loop=object()))
 
         @staticmethod
-        @pytest.mark.parametrize(
-            "bad_secs",
-            [None, "2", defaults.DEFAULT_CLOCK_START, datetime.timedelta(seconds=2)],
-        )
-        async def test_invalid_secs(clock, bad_secs):
-            with pytest.raises(TypeError, match=r"^must be int or float$"):
-                await clock.async_sleep_function(bad_secs)
+        @pytest.mark.parametrize("bad_secs", INVALID_SECS)
+        def test_invalid_secs(clock, bad_secs):
+            with pytest.raises(TypeError, match=MUST_BE_INT_OR_FLOAT):
+                run_without_loop(clock.async_sleep_function(bad_secs))
 
         @staticmethod
-        @pytest.mark.parametrize("secs", [0, 1, 2, 0.0, 0.1, 2.2])
-        async def test_valid_secs(clock, secs):
+        @pytest.mark.parametrize(
+            "secs,expected",
+            [(s, datetime.timedelta(seconds=s)) for s in [0, 1, 2, 0.0, 0.1]],
+        )
+        def test_valid_secs(clock, secs, expected):
             result = "a-result"
-            assert await clock.async_sleep_function(secs, "a-result") is result
-            assert clock.current_datetime == clock.start + clock_module.from_change(
-                secs
-            )
+            sleep = clock.async_sleep_function(secs, result)
+            assert run_without_loop(sleep) is result
+            assert clock.current_datetime == clock.start + expected
 
     class TestRunAt:
         @staticmethod
-        @pytest.mark.parametrize("steps", range(-5, 0))
+        @pytest.mark.parametrize("steps", [-5, -1])
         def test_negative_steps(clock, steps, call_collector):
             delta = datetime.timedelta(seconds=steps)
             when = clock.current_datetime + delta
-            with pytest.raises(ValueError, match=r"^time must be in the future$"):
+            with pytest.raises(ValueError, match=TIME_MUST_BE_IN_FUTURE):
                 clock.run_at(call_collector, when)
 
         @staticmethod
@@ -405,35 +540,59 @@ class TestClock:
             assert call_collector.calls == [clock.start + clock.step]
 
         @staticmethod
-        def test_run_all(clock, call_collector):
-            d1 = clock.current_datetime + datetime.timedelta(seconds=1)
-            d2 = clock.current_datetime + datetime.timedelta(seconds=1.5)
-            d3 = clock.current_datetime + datetime.timedelta(seconds=1.5)
-            d4 = clock.current_datetime + datetime.timedelta(seconds=2)
-            clock.run_at(call_collector, d1)
-            clock.run_at(call_collector, d2)
-            clock.run_at(call_collector, d3)
-            clock.run_at(call_collector, d4)
+        def test_run_all(clock, call_collector, run_deltas):
+            whens = [clock.current_datetime + delta for delta in run_deltas]
+            for when in whens:
+                clock.run_at(call_collector, when)
             clock.elapse_steps(3)
-            assert call_collector.calls == [d1, d2, d3, d4]
+            assert call_collector.calls == whens
+
+        @staticmethod
+        def test_run_at_current_conversions(clock):
+            seen: list[tuple[datetime.datetime, datetime.datetime]] = []
+
+            def record(c: clock_module.Clock) -> None:
+                seen.append((c.current_tz_datetime, c.current_utc_datetime))
+
+            when = clock.current_datetime + clock.step
+            assert clock.current_utc_datetime == clock.utc_start
+            clock.run_at(record, when)
+            clock.elapse_steps(2)
+            assert seen == [(clock.as_tz(when), clock.as_utc(when))]
+            assert clock.current_tz_datetime == clock.as_tz(clock.current_datetime)
+            assert clock.current_utc_datetime == clock.as_utc(clock.current_datetime)
+
+        @staticmethod
+        def test_separate_clocks(clock, clock_start, call_collector):
+            other = clock_module.Clock(clock_start)
+            clock.run_at(call_collector, clock.current_datetime)
+            other.elapse_steps()
+            assert call_collector.calls == []
+            clock.elapse_steps()
+            assert call_collector.calls == [clock.start]
+
+        @staticmethod
+        def test_run_same_time(clock):
+            order: list[str] = []
+
+            def appender(name: str) -> clock_module.Action:
+                def append(_: clock_module.Clock) -> None:
+                    order.append(name)
+
+                return append
+
+            when = clock.current_datetime + clock.step
+            for name in ("first", "second", "third"):
+                clock.run_at(appender(name), when)
+            clock.elapse_steps()
+            assert order == ["first", "second", "third"]
 
     @staticmethod
-    def test_run_in(clock, call_collector):
-        delta1 = datetime.timedelta(seconds=1)
-        delta2 = datetime.timedelta(seconds=1.5)
-        delta3 = datetime.timedelta(seconds=1.5)
-        delta4 = datetime.timedelta(seconds=2)
-        clock.run_in(call_collector, delta1)
-        clock.run_in(call_collector, delta2)
-        clock.run_in(call_collector, delta3)
-        clock.run_in(call_collector, delta4)
+    def test_run_in(clock, call_collector, run_deltas):
+        for delta in run_deltas:
+            clock.run_in(call_collector, delta)
         clock.elapse_steps(3)
-        assert call_collector.calls == [
-            clock.start + delta1,
-            clock.start + delta2,
-            clock.start + delta3,
-            clock.start + delta4,
-        ]
+        assert call_collector.calls == [clock.start + delta for delta in run_deltas]
 
     @staticmethod
     @pytest.mark.parametrize("clock_step", [1, 2, 3])
@@ -482,6 +641,30 @@ class TestClock:
                 with pytest.raises(clock_module.LockError, match=r"^already locked$"):
                     with clock.lock():
                         pytest.fail("nested locks not supported")
+                assert clock.is_locked
+
+        @staticmethod
+        def test_elapse_while_locked(clock):
+            with clock.lock():
+                with pytest.raises(clock_module.LockError, match=r"^already locked$"):
+                    clock.elapse_steps()
+            assert clock.current_datetime == clock.start
+
+        @staticmethod
+        def test_as_decorator(clock):
+            @clock.lock()
+            def locked():
+                return clock.is_locked
+
+            assert locked()
+            assert not clock.is_locked
+
+        @staticmethod
+        def test_released_on_error(clock):
+            with pytest.raises(RuntimeError):
+                with clock.lock():
+                    raise RuntimeError
+            assert not clock.is_locked
 
     class TestFromDatetime:
         @staticmethod
@@ -499,15 +682,39 @@ class TestClock:
                 11,
                 11,
                 11,
-                tzinfo=datetime.timezone(datetime.timedelta(seconds=10)),
+                tzinfo=TZ_PLUS_10_SECONDS,
             )
             clock = clock_module.Clock.from_datetime(dt, 5)
             assert clock.start == dt.replace(tzinfo=None)
             assert clock.step == datetime.timedelta(seconds=5)
-            assert clock.local_tz == datetime.timezone(datetime.timedelta(seconds=10))
+            assert clock.local_tz == TZ_PLUS_10_SECONDS
 
 
 class TestMark:
+    @staticmethod
+    @pytest.mark.parametrize("clock_local_tz", [TZ_MINUS_7_HOURS])
+    def test_utc_when(clock):
+        clock.elapse_steps()
+        mark = clock.mark()
+        expected = (mark.when + datetime.timedelta(hours=7)).replace(
+            tzinfo=datetime.timezone.utc
+        )
+        assert mark.utc_when == expected
+        assert mark.utc_when.tzinfo is datetime.timezone.utc
+        assert mark.tz_when.tzinfo is TZ_MINUS_7_HOURS
+
+    @staticmethod
+    def test_weakref(clock):
+        mark = clock.mark()
+        assert weakref.ref(clock)() is clock
+        assert weakref.ref(mark)() is mark
+
+    @staticmethod
+    def test_copy(clock):
+        mark = clock.mark()
+        assert copy.copy(mark) == mark
+        assert copy.deepcopy(mark).when == mark.when
+
     class TestSorting:
         @staticmethod
         @pytest.mark.parametrize("value", [None, 2.0, defaults.DEFAULT_CLOCK_START, 6])
@@ -545,7 +752,8 @@ class TestMark:
             assert m1 < m2
 
         @staticmethod
-        def test_general_sorting(clock):
+        @pytest.fixture
+        def five_marks(clock):
             m1 = clock.mark()
             clock.elapse_steps()
             m2 = clock.mark()
@@ -554,8 +762,12 @@ class TestMark:
             m4 = clock.mark()
             clock.elapse_steps()
             m5 = clock.mark()
-            unordered = [m2, m4, m1, m5, m3]
-            assert sorted(unordered) == [m1, m2, m3, m4, m5]
+            return [m1, m2, m3, m4, m5]
+
+        @staticmethod
+        def test_general_sorting(five_marks):
+            unordered = [five_marks[i] for i in (1, 3, 0, 4, 2)]
+            assert sorted(unordered) == five_marks
 
     @staticmethod
     def test_elapsed(clock):
@@ -563,30 +775,6 @@ class TestMark:
         mark = clock.mark()
         assert mark.elapsed == (clock.start + (clock.step * 5)) - clock.start
 
-    class TestAdd:
-        @staticmethod
-        @pytest.fixture
-        def mark(clock):
-            clock.elapse_steps()
-            return clock.mark()
-
-        @staticmethod
-        @pytest.mark.parametrize("value", [None, 2.0, defaults.DEFAULT_CLOCK_START])
-        def test_unsupported(mark, value):
-            with pytest.raises(TypeError):
-                mark + value  # type: ignore
-
-        @staticmethod
-        @pytest.mark.parametrize("steps", range(-4, 5))
-        def test_int(mark, steps):
-            assert mark + steps == mark.when + mark.clock.step * steps
-
-        @staticmethod
-        @pytest.mark.parametrize("seconds", range(5))
-        def test_timedelta(mark, seconds):
-            td = datetime.timedelta(seconds=seconds)
-            assert mark + td == mark.when + td
-
     class TestOperators:
         @staticmethod
         @pytest.fixture
@@ -667,12 +855,20 @@ class TestMark:
                 assert dt - mark == datetime.timedelta(seconds=4)
 
 
+@pytest.mark.usefixtures("time_functions_restored")
 class TestInstalled:
+    @staticmethod
+    @pytest.fixture
+    def restored_target_module():
+        snapshot = module_snapshot.snapshot_module(target_module)
+        try:
+            yield
+        finally:
+            module_snapshot.restore_module(target_module, snapshot)
+
     @staticmethod
     def test_standard(clock):
-        original_time = time.time
-        original_sleep = time.sleep
-        original_async_sleep = asyncio.sleep
+        original_time, original_sleep, original_async_sleep = ORIGINAL_TIME_FUNCTIONS
         with clock_module.installed(clock) as (time_functions, clk):
             assert time.time == clock.time_function
             assert time.sleep == clock.sleep_function
@@ -686,6 +882,7 @@ class TestInstalled:
         assert asyncio.sleep == time_functions.async_sleep
 
     @staticmethod
+    @pytest.mark.usefixtures("restored_target_module")
     def test_alternate(clock):
         original_time = target_module.time_func
         original_sleep = target_module.sleep_func
@@ -717,10 +914,8 @@ class TestInstalled:
 
     @staticmethod
     def test_tz_datetime():
-        dt = datetime.datetime(
-            2018, 11, 11, 11, tzinfo=datetime.timezone(datetime.timedelta(hours=10))
-        )
+        dt = datetime.datetime(2018, 11, 11, 11, tzinfo=TZ_PLUS_10_HOURS)
         with clock_module.installed(dt) as (_, clock):
             assert clock.start == dt.replace(tzinfo=None)
             assert clock.step == datetime.timedelta(seconds=1)
-            assert clock.local_tz == datetime.timezone(datetime.timedelta(hours=10))
+            assert clock.local_tz == TZ_PLUS_10_HOURS
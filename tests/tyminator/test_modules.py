@@ -1,8 +1,11 @@
 # Copyright 2023 The Milton Hirsch Institute, B.V.
 # SPDX-License-Identifier: Apache-2.0
 
+"""PYTEST_DONT_REWRITE"""
+
 import types
 import typing
+import warnings
 
 import pytest
 
@@ -10,51 +13,60 @@ from tyminator import clock
 from tyminator import defaults
 from tyminator.util import monkey_patch
 
-TYPING_VALUE_IDS = {id(v := getattr(typing, s)): v for s in dir(typing)}
+with warnings.catch_warnings():
+    # Some typing aliases (typing.io, typing.re) warn when accessed.
+    warnings.simplefilter("ignore", DeprecationWarning)
+    # Held so that the ids below cannot be reused by other objects.
+    TYPING_VALUES = tuple(getattr(typing, s) for s in dir(typing))
+TYPING_VALUE_IDS = frozenset(map(id, TYPING_VALUES))
 
 
 @pytest.mark.parametrize("module", [clock, defaults, monkey_patch])
 class TestModule:
     @staticmethod
     def test_has_all(module):
-        assert hasattr(module, "__all__")
-        assert isinstance(module.__all__, tuple)
-
-    @staticmethod
-    def test_all_string(module):
-        for symbol in module.__all__:
-            assert isinstance(symbol, str)
-
-    @staticmethod
-    def test_all_public(module):
-        for symbol in module.__all__:
-            assert not symbol.startswith("_")
-
-    @staticmethod
-    def test_no_modules(module):
-        for symbol in module.__all__:
-            value = getattr(module, symbol)
-            assert not isinstance(value, types.ModuleType)
-
-    @staticmethod
-    def test_no_typing_symbols(module):
-        for symbol in module.__all__:
-            value = getattr(module, symbol)
-            assert id(value) not in TYPING_VALUE_IDS
+        assert hasattr(module, "__all__"), f"{module.__name__} has no __all__"
+        assert isinstance(module.__all__, tuple), "__all__ is not a tuple"
 
     @staticmethod
-    def test_no_missing(module):
+    def test_all_consistent(module):
+        """Walks dir(module) once, checking __all__ against every symbol."""
+        symbols = dir(module)
         all_symbols = set(module.__all__)
-        for symbol in dir(module):
+        non_strings = {s for s in all_symbols if not isinstance(s, str)}
+        undefined = all_symbols - non_strings - set(symbols)
+        private = set()
+        modules = set()
+        typing_symbols = set()
+        missing = set()
+        for symbol in symbols:
             value = getattr(module, symbol)
-            if not (
-                symbol.startswith("_")
-                or isinstance(value, types.ModuleType)
+            is_private = symbol.startswith("_")
+            is_module = isinstance(value, types.ModuleType)
+            is_typing = id(value) in TYPING_VALUE_IDS
+            if symbol in all_symbols:
+                if is_private:
+                    private.add(symbol)
+                if is_module:
+                    modules.add(symbol)
+                if is_typing:
+                    typing_symbols.add(symbol)
+            elif not (
+                is_private
+                or is_module
+                or is_typing
                 or isinstance(value, typing.TypeVar)
-                or id(value) in TYPING_VALUE_IDS
             ):
-                assert symbol in all_symbols
+                missing.add(symbol)
+
+        assert not non_strings, f"non-string __all__ entries: {non_strings!r}"
+        assert not undefined, f"undefined in module: {sorted(undefined)}"
+        assert not private, f"private symbols exported: {sorted(private)}"
+        assert not modules, f"modules exported: {sorted(modules)}"
+        assert not typing_symbols, f"typing symbols exported: {sorted(typing_symbols)}"
+        assert not missing, f"missing from __all__: {sorted(missing)}"
 
     @staticmethod
     def test_all_sorted(module):
-        assert module.__all__ == tuple(sorted(module.__all__))
+        expected = tuple(sorted(module.__all__))
+        assert module.__all__ == expected, f"__all__ should be {expected!r}"
@@ -2,63 +2,105 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import importlib
+import operator
+import re
 import sys
 
 import pytest
 
+from tests.tyminator import module_snapshot
 from tests.tyminator.util import target_module
 from tyminator.util import monkey_patch
 
+# Dotted names are not interned automatically by the compiler.
+TOP_QUALNAME = sys.intern("Top")
+NESTED_QUALNAME = sys.intern("Top.Nested")
+DOUBLE_NESTED_QUALNAME = sys.intern("Top.Nested.DoubleNested")
+
+OBJECT_NAMES = ("object1", "object2", "object3")
+
+# Reusable because targets are restored before the next test runs.
+SENTINELS = (object(), object(), object())
+
+SPEC_QUALNAMES = [
+    ("top_spec", TOP_QUALNAME),
+    ("nested_spec", NESTED_QUALNAME),
+    ("double_nested_spec", DOUBLE_NESTED_QUALNAME),
+]
+
+PATCH_FIXTURES = frozenset(
+    {"top_patch", "nested_patch", "double_nested_patch", "patch_set"}
+)
+
+NO_TIME_FUNC_ATTRIBUTE = re.compile(r"^'PatchSet' object has no attribute 'time_func'$")
+
+get_nested = operator.attrgetter(NESTED_QUALNAME)
+get_double_nested = operator.attrgetter(DOUBLE_NESTED_QUALNAME)
+
+
+@pytest.fixture(scope="session")
+def target_module_snapshot():
+    nested = target_module.Top.Nested
+    snapshot = module_snapshot.snapshot_module(target_module)
+    return snapshot, nested, nested.DoubleNested
+
 
 @pytest.fixture(autouse=True)
-def reloaded_target_module():
+def restored_target_module(request, target_module_snapshot):
+    marker = request.node.get_closest_marker("mutates_target")
+    mutates_target = marker or PATCH_FIXTURES.intersection(request.fixturenames)
     try:
         yield
     finally:
-        importlib.reload(target_module)
+        if mutates_target:
+            snapshot, nested, double_nested = target_module_snapshot
+            module_snapshot.restore_module(target_module, snapshot)
+            # Nested patches rebind attributes of the classes themselves.
+            target_module.Top.Nested = nested
+            nested.DoubleNested = double_nested
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def top_spec():
-    return monkey_patch.Spec(target_module.__name__, "Top")
+    return monkey_patch.Spec(target_module.__name__, TOP_QUALNAME)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_spec():
-    return monkey_patch.Spec(target_module.__name__, "Top.Nested")
+    return monkey_patch.Spec(target_module.__name__, NESTED_QUALNAME)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def double_nested_spec():
-    return monkey_patch.Spec(target_module.__name__, "Top.Nested.DoubleNested")
+    return monkey_patch.Spec(target_module.__name__, DOUBLE_NESTED_QUALNAME)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def object1_spec():
     return monkey_patch.Spec(target_module.__name__, "object1")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def object2_spec():
     return monkey_patch.Spec(target_module.__name__, "object2")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def object3_spec():
     return monkey_patch.Spec(target_module.__name__, "object3")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def top_patch(top_spec):
     return monkey_patch.Patch.from_spec(top_spec)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_patch(nested_spec):
     return monkey_patch.Patch.from_spec(nested_spec)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def double_nested_patch(double_nested_spec):
     return monkey_patch.Patch.from_spec(double_nested_spec)
 
@@ -89,76 +131,54 @@ class TestSpec:
 
         @staticmethod
         def test_double_nested(double_nested_spec):
-            assert double_nested_spec.parent_qualified_name == "Top.Nested"
+            assert double_nested_spec.parent_qualified_name == NESTED_QUALNAME
 
     class TestGetModule:
         @staticmethod
         def test_warm(top_spec, nested_spec, double_nested_spec):
+            importlib.import_module(target_module.__name__)
             for spec in top_spec, nested_spec, double_nested_spec:
-                importlib.import_module(spec.module_name)
                 assert spec.get_module() is target_module
 
         @staticmethod
         def test_cold(top_spec, nested_spec, double_nested_spec):
-            original_modules = sys.modules
-            sys.modules = dict(original_modules)
-            try:
-                for spec in top_spec, nested_spec, double_nested_spec:
-                    sys.modules.pop(spec.module_name, None)
-                    assert spec.get_module().Top.Nested.DoubleNested
-            finally:
-                sys.modules = original_modules
+            for spec in top_spec, nested_spec, double_nested_spec:
+                saved = sys.modules.pop(spec.module_name)
+                try:
+                    assert get_double_nested(spec.get_module())
+                finally:
+                    sys.modules[spec.module_name] = saved
 
     @staticmethod
-    def test_get_obj(top_spec, nested_spec, double_nested_spec):
-        assert top_spec.get_obj() is target_module.Top
-        assert nested_spec.get_obj() is target_module.Top.Nested
-        assert double_nested_spec.get_obj() is target_module.Top.Nested.DoubleNested
+    @pytest.mark.parametrize("spec_fixture,qualname", SPEC_QUALNAMES)
+    def test_get_obj(request, spec_fixture, qualname):
+        spec = request.getfixturevalue(spec_fixture)
+        assert spec.get_obj() is operator.attrgetter(qualname)(target_module)
 
     @staticmethod
-    def test_from_target(top_spec, nested_spec, double_nested_spec):
-        assert monkey_patch.Spec.from_target(target_module.Top) == top_spec
-        assert monkey_patch.Spec.from_target(target_module.Top.Nested) == nested_spec
-        assert (
-            monkey_patch.Spec.from_target(target_module.Top.Nested.DoubleNested)
-            == double_nested_spec
-        )
+    @pytest.mark.parametrize("spec_fixture,qualname", SPEC_QUALNAMES)
+    def test_from_target(request, spec_fixture, qualname):
+        spec = request.getfixturevalue(spec_fixture)
+        target = operator.attrgetter(qualname)(target_module)
+        assert monkey_patch.Spec.from_target(target) == spec
 
 
 class TestPatch:
-    class TestInstallAndRestore:
-        @staticmethod
-        def test_top(top_patch):
-            new_object = object()
-            try:
-                top_patch.install(new_object)
-                assert target_module.Top is new_object
-            finally:
-                top_patch.restore()
-                assert target_module.Top is top_patch.original_obj
-
-        @staticmethod
-        def test_nested(nested_patch):
-            new_object = object()
-            try:
-                nested_patch.install(new_object)
-                assert target_module.Top.Nested is new_object
-            finally:
-                nested_patch.restore()
-                assert target_module.Top.Nested is nested_patch.original_obj
-
-        @staticmethod
-        def test_double_nested(double_nested_patch):
-            new_object = object()
-            try:
-                double_nested_patch.install(new_object)
-                assert target_module.Top.Nested.DoubleNested is new_object
-            finally:
-                double_nested_patch.restore()
-                assert (
-                    target_module.Top.Nested.DoubleNested
-                    is double_nested_patch.original_obj
-                )
+    @staticmethod
+    @pytest.mark.mutates_target
+    @pytest.mark.parametrize(
+        "patch_fixture", ["top_patch", "nested_patch", "double_nested_patch"]
+    )
+    def test_install_and_restore(request, patch_fixture):
+        patch = request.getfixturevalue(patch_fixture)
+        get_obj = operator.attrgetter(patch.spec.qualified_name)
+        new_object = SENTINELS[0]
+        try:
+            patch.install(new_object)
+            assert get_obj(target_module) is new_object
+        finally:
+            patch.restore()
+            assert get_obj(target_module) is patch.original_obj
 
     @staticmethod
     def test_from_spec(top_spec, nested_spec, double_nested_spec):
@@ -170,16 +190,19 @@ class TestPatch:
         assert nested_patch.spec is nested_spec
         assert double_nested_patch.spec is double_nested_spec
 
-        assert top_patch.original_obj is target_module.Top
-        assert nested_patch.original_obj is target_module.Top.Nested
-        assert double_nested_patch.original_obj is target_module.Top.Nested.DoubleNested
+        top = target_module.Top
+        nested = top.Nested
+        double_nested = nested.DoubleNested
+        assert top_patch.original_obj is top
+        assert nested_patch.original_obj is nested
+        assert double_nested_patch.original_obj is double_nested
 
     @staticmethod
     def test_from_target(top_patch, nested_patch, double_nested_patch):
         assert monkey_patch.Patch.from_target(target_module.Top) == top_patch
-        assert monkey_patch.Patch.from_target(target_module.Top.Nested) == nested_patch
+        assert monkey_patch.Patch.from_target(get_nested(target_module)) == nested_patch
         assert (
-            monkey_patch.Patch.from_target(target_module.Top.Nested.DoubleNested)
+            monkey_patch.Patch.from_target(get_double_nested(target_module))
             == double_nested_patch
         )
 
@@ -192,16 +215,16 @@ class TestPatch:
         nested_patch,
         double_nested_patch,
     ):
-        assert monkey_patch.Patch.from_any(top_spec) == top_patch
-        assert monkey_patch.Patch.from_any(nested_spec) == nested_patch
-        assert monkey_patch.Patch.from_any(double_nested_spec) == double_nested_patch
-
-        assert monkey_patch.Patch.from_any(target_module.Top) == top_patch
-        assert monkey_patch.Patch.from_any(target_module.Top.Nested) == nested_patch
-        assert (
-            monkey_patch.Patch.from_any(target_module.Top.Nested.DoubleNested)
-            == double_nested_patch
-        )
+        cases = [
+            (top_spec, top_patch),
+            (nested_spec, nested_patch),
+            (double_nested_spec, double_nested_patch),
+            (target_module.Top, top_patch),
+            (get_nested(target_module), nested_patch),
+            (get_double_nested(target_module), double_nested_patch),
+        ]
+        for any_value, expected in cases:
+            assert monkey_patch.Patch.from_any(any_value) == expected
 
 
 class TestPatchSet:
@@ -227,58 +250,58 @@ class TestPatchSet:
         @staticmethod
         def test_immutable():
             patch_set = monkey_patch.PatchSet()
-            with pytest.raises(
-                AttributeError, match=r"'PatchSet' object has no attribute 'time_func'"
-            ):
+            with pytest.raises(AttributeError, match=NO_TIME_FUNC_ATTRIBUTE):
                 patch_set.time_func = target_module.object1
 
         @staticmethod
         def test_no_such_patch(patch_set):
+            assert "no_such_patch" not in patch_set
             with pytest.raises(AttributeError):
                 patch_set.no_such_patch
 
+        @staticmethod
+        def test_contains(patch_set):
+            assert "object1" in patch_set
+            assert "object2" in patch_set
+            assert "object3" in patch_set
+            assert "install" not in patch_set
+
     class TestInstall:
         @staticmethod
         def test_missing_patches(patch_set):
-            with pytest.raises(
-                ValueError, match=r"^missing patches: object2, object3$"
-            ):
-                patch_set.install(object1=object())
+            with pytest.raises(ValueError) as exc_info:
+                patch_set.install(object1=SENTINELS[0])
+            assert str(exc_info.value) == "missing patches: object2, object3"
             assert target_module.object1 is patch_set.object1
             assert target_module.object2 is patch_set.object2
             assert target_module.object3 is patch_set.object3
 
         @staticmethod
         def test_unexpected_patches(patch_set):
-            with pytest.raises(
-                ValueError, match=r"unexpected patches: unknown1, unknown2"
-            ):
+            with pytest.raises(ValueError) as exc_info:
                 patch_set.install(
-                    object1=object(),
-                    object2=object(),
-                    object3=object(),
-                    unknown1=object(),
-                    unknown2=object(),
+                    **dict(zip(OBJECT_NAMES, SENTINELS)),
+                    unknown1=SENTINELS[0],
+                    unknown2=SENTINELS[1],
                 )
+            assert str(exc_info.value) == "unexpected patches: unknown1, unknown2"
             assert target_module.object1 is patch_set.object1
             assert target_module.object2 is patch_set.object2
             assert target_module.object3 is patch_set.object3
 
         @staticmethod
+        @pytest.mark.mutates_target
         def test_install(patch_set):
-            object1 = object()
-            object2 = object()
-            object3 = object()
-            patch_set.install(object1=object1, object2=object2, object3=object3)
-            assert target_module.object1 is object1
-            assert target_module.object2 is object2
-            assert target_module.object3 is object3
+            objects = dict(zip(OBJECT_NAMES, SENTINELS))
+            patch_set.install(**objects)
+            for name, obj in objects.items():
+                assert getattr(target_module, name) is obj
 
     @staticmethod
+    @pytest.mark.mutates_target
     def test_restore(patch_set):
-        target_module.object1 = object()
-        target_module.object2 = object()
-        target_module.object3 = object()
+        for name, sentinel in zip(OBJECT_NAMES, SENTINELS):
+            setattr(target_module, name, sentinel)
         patch_set.restore()
         assert target_module.object1 is patch_set.object1
         assert target_module.object2 is patch_set.object2
@@ -6,10 +6,11 @@ import contextlib
 import dataclasses
 import datetime
 import functools
-import operator
+import heapq
 from typing import Any
 from typing import Callable
 from typing import Final
+from typing import Optional
 from typing import Union
 
 from tyminator.util import monkey_patch
@@ -19,44 +20,101 @@ Step = Union[int, datetime.timedelta]
 Action = Callable[["Clock"], None]
 
 _ZERO_TIMEDELTA: Final = datetime.timedelta()
+_ONE_SECOND: Final = datetime.timedelta(seconds=1)
+_COMMON_SECONDS: Final = {n: _ONE_SECOND * n for n in (1, 5, 10, 30, 60)}
+
+_NAIVE_EPOCH: Final = datetime.datetime(1970, 1, 1)
 
 
 class LockError(Exception):
     """Raised when trying to take a step when clock not ready."""
 
 
+def _int_seconds(value: int) -> datetime.timedelta:
+    common = _COMMON_SECONDS.get(value)
+    if common is None:
+        return _ONE_SECOND * value
+    else:
+        return common
+
+
+def _seconds(value: float) -> datetime.timedelta:
+    return datetime.timedelta(seconds=value)
+
+
+_STEP_CONVERTERS: Final[dict[type, Callable[[Any], datetime.timedelta]]] = {
+    int: _int_seconds,
+    datetime.timedelta: lambda step: step,
+}
+
+_CHANGE_CONVERTERS: Final[dict[type, Callable[[Any], datetime.timedelta]]] = {
+    int: _int_seconds,
+    float: _seconds,
+    datetime.timedelta: lambda change: change,
+}
+
+
+def _delay_seconds(delay: Any) -> float:
+    if not isinstance(delay, (int, float)):
+        raise TypeError("must be int or float")
+    return float(delay)
+
+
 def from_step(step: Step) -> datetime.timedelta:
-    if isinstance(step, int):
-        return datetime.timedelta(seconds=step)
+    converter = _STEP_CONVERTERS.get(type(step))
+    if converter is not None:
+        return converter(step)
+    elif isinstance(step, int):
+        return _int_seconds(step)
     else:
         return step
 
 
 def from_change(change: Change) -> datetime.timedelta:
-    if isinstance(change, int):
-        change = float(change)
-    if isinstance(change, float):
-        return datetime.timedelta(seconds=change)
+    converter = _CHANGE_CONVERTERS.get(type(change))
+    if converter is not None:
+        return converter(change)
+    elif isinstance(change, (int, float)):
+        return _seconds(float(change))
     else:
         return change
 
 
-class Clock:
-    @dataclasses.dataclass(frozen=True, eq=False)
-    class __Event:
-        when: datetime.datetime
-        action: Action
+class _Lock(contextlib.ContextDecorator):
+    """Non-reentrant flag, reused as the context manager behind Clock.lock()."""
+
+    locked: bool
+
+    def __init__(self):
+        self.locked = False
+
+    def check(self) -> None:
+        if self.locked:
+            raise LockError("already locked")
+
+    def __enter__(self) -> None:
+        self.check()
+        self.locked = True
+
+    def __exit__(self, *exc_info) -> None:
+        self.locked = False
 
-        SORT_KEY = operator.attrgetter("when", "action")
 
+class Clock:
     __current_datetime: datetime.datetime
+    __current_tz_datetime: Optional[datetime.datetime]
+    __current_utc_datetime: Optional[datetime.datetime]
     __start: datetime.datetime
-    __utc_start: datetime.datetime
+    __tz_start: Optional[datetime.datetime]
+    __utc_start: Optional[datetime.datetime]
     __local_tz: datetime.tzinfo
     __step: datetime.timedelta
-    __is_locked: bool = False
-    __event_queue: list[__Event] = []
-    __mark_seq: int = 0
+    __tz_epoch: Optional[datetime.datetime]
+    __tz_is_utc: bool
+    __lock: _Lock
+    __event_queue: list[tuple[datetime.datetime, int, Action]]
+    __event_seq: int
+    __mark_seq: int
 
     def __init__(
         self,
@@ -68,21 +126,44 @@ class Clock:
         if start.tzinfo is not None:
             raise ValueError("start may not have tzinfo")
         self.__start = self.__current_datetime = start
+        self.__current_tz_datetime = self.__current_utc_datetime = None
         self.__local_tz = local_tz
+        self.__tz_is_utc = local_tz is datetime.timezone.utc
+        if isinstance(local_tz, datetime.timezone):
+            # The Unix epoch as local wall time, for exact timestamp arithmetic.
+            self.__tz_epoch = _NAIVE_EPOCH + local_tz.utcoffset(None)
+        else:
+            self.__tz_epoch = None
+        self.__tz_start = self.__utc_start = None
 
         self.__step = from_step(step)
 
+        self.__lock = _Lock()
+        self.__event_queue = []
+        self.__event_seq = 0
+        self.__mark_seq = 0
+
     @property
     def current_datetime(self) -> datetime.datetime:
         return self.__current_datetime
 
     @property
     def current_tz_datetime(self) -> datetime.datetime:
-        return self.__current_datetime.replace(tzinfo=self.__local_tz)
+        tz_datetime = self.__current_tz_datetime
+        if tz_datetime is None:
+            tz_datetime = self.__current_datetime.replace(tzinfo=self.__local_tz)
+            self.__current_tz_datetime = tz_datetime
+        return tz_datetime
 
     @property
     def current_utc_datetime(self) -> datetime.datetime:
-        return self.current_tz_datetime.astimezone(datetime.timezone.utc)
+        if self.__tz_is_utc:
+            return self.current_tz_datetime
+        utc_datetime = self.__current_utc_datetime
+        if utc_datetime is None:
+            utc_datetime = self.current_tz_datetime.astimezone(datetime.timezone.utc)
+            self.__current_utc_datetime = utc_datetime
+        return utc_datetime
 
     @property
     def current_timestamp(self) -> float:
@@ -90,11 +171,15 @@ class Clock:
 
     @property
     def current_tz_timestamp(self) -> float:
-        return self.current_tz_datetime.timestamp()
+        tz_epoch = self.__tz_epoch
+        if tz_epoch is None:
+            return self.current_tz_datetime.timestamp()
+        else:
+            return (self.__current_datetime - tz_epoch).total_seconds()
 
     @property
     def current_utc_timestamp(self) -> float:
-        return self.current_utc_datetime.timestamp()
+        return self.current_tz_timestamp
 
     @property
     def elapsed(self) -> datetime.timedelta:
@@ -108,13 +193,19 @@ class Clock:
     def start(self) -> datetime.datetime:
         return self.__start
 
-    @functools.cached_property
+    @property
     def tz_start(self) -> datetime.datetime:
-        return self.as_tz(self.__start)
+        tz_start = self.__tz_start
+        if tz_start is None:
+            tz_start = self.__tz_start = self.as_tz(self.__start)
+        return tz_start
 
-    @functools.cached_property
+    @property
     def utc_start(self) -> datetime.datetime:
-        return self.as_utc(self.__start)
+        utc_start = self.__utc_start
+        if utc_start is None:
+            utc_start = self.__utc_start = self.as_utc(self.__start)
+        return utc_start
 
     @property
     def step(self) -> datetime.timedelta:
@@ -122,52 +213,74 @@ class Clock:
 
     @property
     def is_locked(self) -> bool:
-        return self.__is_locked
+        return self.__lock.locked
 
     def as_naive(self, dt: datetime.datetime):
-        if dt.tzinfo is not None:
-            if dt.tzinfo != self.__local_tz:
+        tzinfo = dt.tzinfo
+        if tzinfo is not None:
+            if tzinfo is not self.__local_tz and tzinfo != self.__local_tz:
                 dt = self.as_tz(dt)
             dt = dt.replace(tzinfo=None)
         return dt
 
     def as_tz(self, dt: datetime.datetime):
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=self.local_tz)
+        tzinfo = dt.tzinfo
+        if tzinfo is self.__local_tz:
+            return dt
+        elif tzinfo is None:
+            return dt.replace(tzinfo=self.__local_tz)
         else:
-            return dt.astimezone(self.local_tz)
+            return dt.astimezone(self.__local_tz)
 
     def as_utc(self, dt: datetime.datetime):
-        if dt.tzinfo is None:
+        tzinfo = dt.tzinfo
+        if tzinfo is datetime.timezone.utc:
+            return dt
+        if tzinfo is None:
             dt = self.as_tz(dt)
+            if self.__tz_is_utc:
+                return dt
         return dt.astimezone(datetime.timezone.utc)
 
     def __run_pending_events(self, until: datetime.datetime):
-        while self.__event_queue and (event := self.__event_queue[0]).when <= until:
-            self.__current_datetime = event.when
-            del self.__event_queue[0]
-            action = event.action
+        event_queue = self.__event_queue
+        while event_queue and event_queue[0][0] <= until:
+            when, _, action = heapq.heappop(event_queue)
+            self.__current_datetime = when
+            self.__current_tz_datetime = self.__current_utc_datetime = None
             if asyncio.iscoroutinefunction(action):
                 raise NotImplementedError
             else:
                 action(self)
 
-    def elapse(self, change: Change) -> None:
-        change = from_change(change)
-        if change < _ZERO_TIMEDELTA:
+    def __elapse_delta(self, delta: datetime.timedelta) -> None:
+        if delta < _ZERO_TIMEDELTA:
             raise ValueError("change must be positive or zero")
 
-        with self.lock():
-            next_datetime = self.__current_datetime + change
+        if not self.__event_queue:
+            # No actions can run, so the lock is only checked, never taken.
+            self.__lock.check()
+            self.__current_datetime += delta
+            self.__current_tz_datetime = self.__current_utc_datetime = None
+            return
+
+        with self.__lock:
+            next_datetime = self.__current_datetime + delta
             self.__run_pending_events(next_datetime)
             self.__current_datetime = next_datetime
+            self.__current_tz_datetime = self.__current_utc_datetime = None
+
+    def elapse(self, change: Change) -> None:
+        if type(change) is not datetime.timedelta:
+            change = from_change(change)
+        self.__elapse_delta(change)
 
     def elapse_steps(self, steps: int = 1) -> None:
-        return self.elapse(self.step * steps)
+        self.__elapse_delta(self.__step * steps)
 
     def next_datetime(self) -> datetime.datetime:
         current_datetime = self.__current_datetime
-        self.elapse_steps()
+        self.__elapse_delta(self.__step)
         return current_datetime
 
     def next_tz_datetime(self) -> datetime.datetime:
@@ -183,31 +296,27 @@ class Clock:
             return self.current_timestamp
 
     def sleep_function(self, secs) -> None:
-        asyncio.run(self.async_sleep_function(secs))
+        self.elapse(_delay_seconds(secs))
 
     async def async_sleep_function(self, delay, result=None, *, loop=None) -> Any:
         if loop is not None:
             raise NotImplementedError("loop parameter is unsupported")
-        if not isinstance(delay, (int, float)):
-            raise TypeError("must be int or float")
-        delay = float(delay)
-        self.elapse(delay)
+        self.elapse(_delay_seconds(delay))
         return result
 
     def next_timestamp(self) -> float:
         current_timestamp = self.current_timestamp
-        self.next_datetime()
+        self.__elapse_delta(self.__step)
         return current_timestamp
 
     def next_tz_timestamp(self) -> float:
         current_tz_timestamp = self.current_tz_timestamp
-        self.next_datetime()
+        self.__elapse_delta(self.__step)
         return current_tz_timestamp
 
     def next_utc_timestamp(self) -> float:
-        current_utc_timestamp = self.current_utc_timestamp
-        self.next_datetime()
-        return current_utc_timestamp
+        # The same instant as the tz timestamp, so no UTC conversion is needed.
+        return self.next_tz_timestamp()
 
     def dt_at_step(self, step: int) -> datetime.datetime:
         return self.__start + self.__step * step
@@ -222,9 +331,8 @@ class Clock:
         when = self.as_naive(when)
         if when < self.__current_datetime:
             raise ValueError("time must be in the future")
-        event = self.__Event(when=when, action=action)
-        self.__event_queue.append(event)
-        self.__event_queue.sort(key=self.__Event.SORT_KEY)
+        heapq.heappush(self.__event_queue, (when, self.__event_seq, action))
+        self.__event_seq += 1
 
     def run_in(self, action: Action, change: Change):
         when = self.__current_datetime + from_change(change)
@@ -239,15 +347,8 @@ class Clock:
         self.__mark_seq += 1
         return mark
 
-    @contextlib.contextmanager
-    def lock(self):
-        if self.__is_locked:
-            raise LockError("already locked")
-        try:
-            self.__is_locked = True
-            yield
-        finally:
-            del self.__is_locked
+    def lock(self) -> _Lock:
+        return self.__lock
 
     @classmethod
     def from_datetime(cls, dt: datetime.datetime, step: Step = 1) -> "Clock":
@@ -263,23 +364,28 @@ class Clock:
 @dataclasses.dataclass(frozen=True)
 @functools.total_ordering
 class Mark:
+    __slots__ = ("clock", "when", "seq", "__weakref__")
 
     clock: Clock
     when: datetime.datetime
     seq: int
 
-    @functools.cached_property
+    @property
     def tz_when(self) -> datetime.datetime:
         return self.clock.as_tz(self.when)
 
-    @functools.cached_property
+    @property
     def utc_when(self) -> datetime.datetime:
-        return self.clock.as_utc(self.tz_when)
+        return self.clock.as_utc(self.when)
 
-    @functools.cached_property
+    @property
     def elapsed(self) -> datetime.timedelta:
         return self.when - self.clock.start
 
+    def __reduce__(self):
+        # Frozen slots reject the setattr-based default reconstruction.
+        return Mark, (self.clock, self.when, self.seq)
+
     def __lt__(self, other) -> bool:
         if isinstance(other, Mark) and self.clock is other.clock:
             return (self.when, self.seq) < (other.when, other.seq)
@@ -113,10 +113,12 @@ class PatchSet:
         for patch in self.__patches.values():
             patch.restore()
 
+    def __contains__(self, name: str) -> bool:
+        return name in self.__patches
+
     def __getattr__(self, item):
-        try:
-            patch = self.__patches[item]
-        except KeyError:
+        patch = self.__patches.get(item)
+        if patch is None:
             return getattr(super(), item)
         else:
             return patch.original_obj